@@ -69,30 +69,27 @@ class Repository:
         ):
             raise ValueError("Second commit must be a descendant of first commit")
 
-        old_index = pygit2.Index()
-        new_index = pygit2.Index()
         if old_commit is not None:
             old_tree = self.pygit.get(old_commit).tree
-            old_index.read_tree(old_tree)
         else:
             # This is a special hash that represents an empty tree
             old_tree = self.pygit.get("4b825dc642cb6eb9a060e54bf8d69288fbee4904")
 
         new_tree = self.pygit.get(new_commit).tree
-        new_index.read_tree(new_tree)
 
-        for patch in self.pygit.diff(old_tree, new_tree):
-            if patch.delta.status_char() != "M":
+        # Only iterate over the deltas. Iterating over the diff itself would generate a
+        # textual patch of every changed file, and the deltas already reference the
+        # blobs so there's no need to load the whole of both trees into an index
+        for delta in self.pygit.diff(old_tree, new_tree).deltas:
+            if delta.status_char() != "M":
                 continue
 
-            if not patch.delta.new_file.path.startswith("locales/"):
+            if not delta.new_file.path.startswith("locales/"):
                 continue
 
-            old_file_oid = old_index[patch.delta.old_file.path].oid
-            new_file_oid = new_index[patch.delta.new_file.path].oid
-            old_file = self.pygit.get(old_file_oid)
-            new_file = self.pygit.get(new_file_oid)
-            yield patch.delta.new_file.path, old_file.data, new_file.data
+            old_file = self.pygit.get(delta.old_file.id)
+            new_file = self.pygit.get(delta.new_file.id)
+            yield delta.new_file.path, old_file.data, new_file.data
 
     def get_head_commit_id(self):
         if not self.repo_is_empty:
@@ -129,9 +126,10 @@ class RepositoryWriter:
         if self.repo_is_empty:
             return True
 
-        tree = self.repo.get(self.index.write_tree(self.repo))
-        diff = tree.diff_to_tree(self.repo.get(self.repo.head.target).tree)
-        return bool(diff)
+        # Trees are content-addressed, so comparing their IDs is enough to tell if
+        # anything has changed without having to generate a diff
+        tree_id = self.index.write_tree(self.repo)
+        return tree_id != self.repo.get(self.repo.head.target).tree.id
 
     def write_file(self, filename, contents):
         """
@@ -140,6 +138,12 @@ class RepositoryWriter:
         blob = self.repo.create_blob(contents)
         self.index.add(pygit2.IndexEntry(filename, blob, pygit2.GIT_FILEMODE_BLOB))
 
+    def copy_file(self, reader, filename):
+        """
+        Copies a file from the specified reader without rewriting its contents
+        """
+        self.index.add(reader.index[filename])
+
     def write_config(self, languages, paths):
         self.write_file(
             "l10n.toml",
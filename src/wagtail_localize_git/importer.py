@@ -16,6 +16,7 @@ class Importer:
         self.log = SyncLog.objects.create(
             action=SyncLog.ACTION_PULL, commit_id=commit_id
         )
+        self.translations = []
 
     @transaction.atomic
     def import_resource(self, translation, po):
@@ -54,4 +55,10 @@ class Importer:
                 f"Unable to translate '{translation.source.object_repr}' into {translation.target_locale.get_display_name()}: {repr(e)}"
             )
 
-        self.log.add_translation(translation)
+        self.translations.append(translation)
+
+    def save_log(self):
+        """
+        Logs all the translations that have been imported
+        """
+        self.log.add_translations(self.translations)
@@ -40,6 +40,40 @@ class Resource(models.Model):
                 path=cls.get_path(instance),
             )
 
+    @classmethod
+    def get_for_objects(cls, objects):
+        """
+        Returns a dictionary of resources for the given queryset of TranslatableObjects, keyed by object ID.
+
+        Resources that don't exist yet are created.
+        """
+        missing_objects = list(objects.filter(git_resource__isnull=True))
+        if missing_objects:
+            # Ignore conflicts in case another sync has created some of these in the meantime
+            source_locale = Locale.get_default()
+            cls.objects.bulk_create(
+                [
+                    cls(
+                        object=object,
+                        path=cls.get_path(object.get_instance(source_locale)),
+                    )
+                    for object in missing_objects
+                ],
+                ignore_conflicts=True,
+            )
+
+            # Anything still missing must have conflicted on something else (such as the path)
+            # Create those individually so the error is raised
+            for object in objects.filter(git_resource__isnull=True):
+                cls.get_for_object(object)
+
+        # Note: bulk_create can't return the IDs when ignoring conflicts, so the new resources
+        # are fetched along with the existing ones
+        return {
+            resource.object_id: resource
+            for resource in cls.objects.filter(object__in=objects)
+        }
+
     @classmethod
     def get_path(cls, instance):
         if isinstance(instance, Page):
@@ -97,6 +131,31 @@ class SyncLog(models.Model):
             source_id=translation.source_id,
         )
 
+    def add_translations(self, translations, batch_size=500):
+        """
+        Logs multiple translations using a bulk insert for each batch.
+        """
+        translations = list(translations)
+        for i in range(0, len(translations), batch_size):
+            batch = translations[i : i + batch_size]
+            resources = Resource.get_for_objects(
+                TranslatableObject.objects.filter(
+                    pk__in=[translation.source.object_id for translation in batch]
+                )
+            )
+
+            SyncLogResource.objects.bulk_create(
+                [
+                    SyncLogResource(
+                        log=self,
+                        resource=resources[translation.source.object_id],
+                        locale_id=translation.target_locale_id,
+                        source_id=translation.source_id,
+                    )
+                    for translation in batch
+                ]
+            )
+
 
 class SyncLogResourceQuerySet(models.QuerySet):
     def unique_resources(self):
@@ -1,7 +1,9 @@
+import contextlib
 import logging
 
 from collections import defaultdict
 from pathlib import PurePosixPath
+from uuid import UUID
 
 import polib
 
@@ -9,7 +11,7 @@ from django.conf import settings
 from django.db import transaction
 from django.utils.module_loading import import_string
 from wagtail.models import Locale
-from wagtail_localize.models import Translation
+from wagtail_localize.models import TranslatableObject, Translation
 
 from .git import Repository
 from .importer import Importer
@@ -23,6 +25,48 @@ class SyncPushError(Exception):
     pass
 
 
+def read_po_metadata(po_string):
+    """
+    Returns the metadata of the given PO file without parsing any of its other entries.
+
+    The metadata is stored in the header entry, which is always the first block in the file.
+    """
+    return polib.pofile(po_string.split("\n\n", 1)[0]).metadata
+
+
+def _strip_po_comments(content):
+    """
+    Returns the given PO file content with all comment lines removed.
+
+    Obsolete entries ("#~") are kept as they can still contain translations.
+    """
+    return b"\n".join(
+        line
+        for line in content.splitlines()
+        if not line.startswith(b"#") or line.startswith(b"#~")
+    )
+
+
+def _get_changed_entries(old_po, new_po):
+    """
+    Returns a copy of new_po that only contains the entries that were added or changed since old_po.
+
+    Translation.import_po() does a few queries for every entry it is given so we avoid passing in
+    entries that haven't changed since the last sync.
+    """
+    changed_po = polib.POFile(wrapwidth=new_po.wrapwidth)
+    changed_po.metadata = new_po.metadata
+
+    # Only compare the translation. Hashing/comparing whole POEntry objects also takes
+    # comments and occurrences into account, which is slow and irrelevant to us.
+    old_translations = {(entry.msgctxt, entry.msgid): entry.msgstr for entry in old_po}
+    for entry in new_po:
+        if old_translations.get((entry.msgctxt, entry.msgid)) != entry.msgstr:
+            changed_po.append(entry)
+
+    return changed_po
+
+
 @transaction.atomic
 def _pull(repo, logger):
     # Get the last commit ID that we either pulled or pushed
@@ -38,16 +82,50 @@ def _pull(repo, logger):
         return
 
     importer = Importer(current_commit_id, logger)
-    for filename, _old_content, new_content in repo.get_changed_files(
+
+    changed_files = []
+    for filename, old_content, new_content in repo.get_changed_files(
         last_commit_id, current_commit_id
     ):
-        logger.info(f"Pull: Importing changes in file '{filename}'")
-        po = polib.pofile(new_content.decode("utf-8"))
-        translation = Translation.objects.get(
-            uuid=po.metadata["X-WagtailLocalize-TranslationID"]
+        # If only comments have changed (such as occurrences or translator notes) there can't
+        # be any new translations, so we can skip parsing the file
+        if _strip_po_comments(old_content) == _strip_po_comments(new_content):
+            logger.info(f"Pull: No translation changes in file '{filename}'")
+            continue
+
+        po = _get_changed_entries(
+            polib.pofile(old_content.decode("utf-8")),
+            polib.pofile(new_content.decode("utf-8")),
         )
+        if not po:
+            logger.info(f"Pull: No translation changes in file '{filename}'")
+            continue
+
+        translation_id = UUID(po.metadata["X-WagtailLocalize-TranslationID"])
+        changed_files.append((filename, translation_id, po))
+
+    # Fetch the translations for all changed files in one query
+    # The importer uses the source and target locale of each translation in its messages
+    translations = Translation.objects.select_related(
+        "source", "target_locale"
+    ).in_bulk(
+        [translation_id for _filename, translation_id, _po in changed_files],
+        field_name="uuid",
+    )
+
+    for filename, translation_id, po in changed_files:
+        translation = translations.get(translation_id)
+        if translation is None:
+            logger.warning(
+                f"Pull: Unrecognised translation '{translation_id}' in file '{filename}'"
+            )
+            continue
+
+        logger.info(f"Pull: Importing changes in file '{filename}'")
         importer.import_resource(translation, po)
 
+    importer.save_log()
+
 
 def po_filename_for_object(resource, target_locale=None):
     """
@@ -77,7 +155,6 @@ def locale_po_filename_template_for_object(resource):
     return (PurePosixPath("locales/{locale}") / str(resource.path)).with_suffix(".po")
 
 
-@transaction.atomic
 def _push(repo, logger):
     reader = repo.reader()
     writer = repo.writer()
@@ -87,38 +164,61 @@ def _push(repo, logger):
         writer.copy_unmanaged_files(reader)
 
     def update_po(filename, new_po):
+        current_po_string = None
         if reader is not None:
-            try:
+            with contextlib.suppress(KeyError):
                 current_po_string = reader.read_file(filename).decode("utf-8")
-            except KeyError:
-                pass
-            else:
-                current_po = polib.pofile(current_po_string, wrapwidth=200)
 
-                # Take metadata from existing PO file
-                translation_id = new_po.metadata.get("X-WagtailLocalize-TranslationID")
-                new_po.metadata = current_po.metadata
-                if translation_id:
-                    new_po.metadata["X-WagtailLocalize-TranslationID"] = translation_id
+        if current_po_string is not None:
+            # Take metadata from existing PO file
+            translation_id = new_po.metadata.get("X-WagtailLocalize-TranslationID")
+            new_po.metadata = read_po_metadata(current_po_string)
+            if translation_id:
+                new_po.metadata["X-WagtailLocalize-TranslationID"] = translation_id
 
-        writer.write_file(filename, str(new_po))
+        new_po_string = str(new_po)
+        if new_po_string == current_po_string:
+            # Most files don't change between syncs, reuse the existing blob for those
+            writer.copy_file(reader, filename)
+        else:
+            writer.write_file(filename, new_po_string)
 
     source_locale = Locale.get_default()
-    target_locales = Locale.objects.exclude(id=source_locale.id)
+    # Evaluated once as this is used in multiple queries and for the config below
+    target_locales = list(Locale.objects.exclude(id=source_locale.id))
+
+    translations = Translation.objects.filter(
+        source__locale=source_locale, target_locale__in=target_locales, enabled=True
+    )
+
+    # Fetch the resources for all objects up front rather than once per translation
+    resources = Resource.get_for_objects(
+        TranslatableObject.objects.filter(
+            pk__in=translations.values("source__object_id")
+        )
+    )
 
     paths = defaultdict(list)
+    source_po_filenames = set()
+    # Stream the translations in chunks as there may be a lot of them
     for translation in (
-        Translation.objects.filter(
-            source__locale=source_locale, target_locale__in=target_locales, enabled=True
-        )
-        .select_related("source", "target_locale")
+        translations.select_related("source", "target_locale")
         .order_by("target_locale__language_code")
+        .iterator(chunk_size=200)
     ):
-        resource = Resource.get_for_object(translation.source.object)
-
-        source_po = translation.source.export_po()
+        resource = resources.get(translation.source.object_id)
+        if resource is None:
+            # The translation was created or enabled after the resources were fetched
+            resource = Resource.get_for_object(translation.source.object)
+            resources[translation.source.object_id] = resource
+
+        # Each source has a translation for every target locale, but the template
+        # only needs to be generated and merged into the repository once
         source_po_filename = po_filename_for_object(resource)
-        update_po(str(source_po_filename), source_po)
+        if source_po_filename not in source_po_filenames:
+            source_po = translation.source.export_po()
+            update_po(str(source_po_filename), source_po)
+            source_po_filenames.add(source_po_filename)
 
         locale_po = translation.export_po()
         update_po(
@@ -147,29 +247,42 @@ def _push(repo, logger):
     if writer.has_changes():
         previous_commit = repo.get_head_commit_id()
 
-        # Create a new log for this push
-        log = SyncLog.objects.create(action=SyncLog.ACTION_PUSH, commit_id="")
-
         logger.info("Push: Committing changes")
-        log.commit_id = writer.commit("Updates to source content")
-        log.save(update_fields=["commit_id"])
+        commit_id = writer.commit("Updates to source content")
         successful_push = repo.push()
         if not successful_push:
-            raise SyncPushError(f"Failed to push reference {log.commit_id}")
+            raise SyncPushError(f"Failed to push reference {commit_id}")
 
         # Add any resources that have changed to the log
         # This ignores any deletions since we don't care about those
+        translation_ids = []
         for _filename, _old_content, new_content in repo.get_changed_files(
-            previous_commit, log.commit_id
+            previous_commit, commit_id
         ):
             # Note: get_changed_files only picks up changes in the locales/ folder so we can assume they're all PO
             # files and they have a Translation ID
             # (anything else that gets in there won't be written into the new commit so, effectively, they get deleted)
-            po = polib.pofile(new_content.decode("utf-8"))
-            translation = Translation.objects.get(
-                uuid=po.metadata["X-WagtailLocalize-TranslationID"]
+            metadata = read_po_metadata(new_content.decode("utf-8"))
+            translation_ids.append(UUID(metadata["X-WagtailLocalize-TranslationID"]))
+
+        translations = Translation.objects.select_related("source").in_bulk(
+            translation_ids, field_name="uuid"
+        )
+        for translation_id in translation_ids:
+            if translation_id not in translations:
+                logger.warning(
+                    f"Push: Unrecognised translation '{translation_id}', not adding it to the log"
+                )
+
+        # Create a new log for this push
+        # Note: This is the only part of the push that needs a transaction. The generation
+        # of PO files and git operations above can take a while so we don't hold one open
+        # for all of that
+        with transaction.atomic():
+            log = SyncLog.objects.create(
+                action=SyncLog.ACTION_PUSH, commit_id=commit_id
             )
-            log.add_translation(translation)
+            log.add_translations(translations.values())
 
     else:
         logger.info(
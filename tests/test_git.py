@@ -281,6 +281,18 @@ class TestRepositoryWriter(GitTestCase):
 
         self.assert_file_in_tree(commit.tree, "test.txt", check_contents=check_contents)
 
+    def test_copy_file(self):
+        index = pygit2.Index()
+        self.add_file_to_index(self.repo, index, "test.txt", "this is a test")
+        self.make_commit_from_index(self.repo, index, "First commit")
+
+        writer = self.repo.writer()
+        writer.write_file("test.txt", "this is an updated test")
+        writer.copy_file(self.repo.reader(), "test.txt")
+
+        # The copied file should replace the one that was written
+        self.assertFalse(writer.has_changes())
+
     def test_has_changes(self):
         writer = self.repo.writer()
 
@@ -81,6 +81,10 @@ class TestImporter(TestCase):
             "The test synchronized field",
         )
 
+        # The log is only written once the importer is finished
+        self.assertFalse(SyncLog.objects.get().resources.exists())
+        importer.save_log()
+
         # Check log
         log = SyncLog.objects.get()
         self.assertEqual(log.action, SyncLog.ACTION_PULL)
@@ -115,6 +119,9 @@ class TestImporter(TestCase):
             "The test synchronized field",
         )
 
+        # The log is only written once the importer is finished
+        importer.save_log()
+
         # Check log
         log = SyncLog.objects.exclude(id=log.id).get()
         self.assertEqual(log.action, SyncLog.ACTION_PULL)
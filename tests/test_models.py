@@ -1,12 +1,17 @@
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 from testapp.models import TestPage, TestSnippet
 from wagtail.documents.models import Document
 from wagtail.images.models import Image
 from wagtail.images.tests.utils import get_test_image_file
-from wagtail.models import Page, Site
-from wagtail_localize.models import TranslationSource
+from wagtail.models import Locale, Page, Site
+from wagtail_localize.models import (
+    TranslatableObject,
+    Translation,
+    TranslationSource,
+)
 
-from wagtail_localize_git.models import Resource
+from wagtail_localize_git.models import Resource, SyncLog
 
 
 def create_test_page(**kwargs):
@@ -32,6 +37,52 @@ class TestResource(TestCase):
         self.assertEqual(resource.object, source.object)
         self.assertEqual(resource.path, "pages/test-page")
 
+    def test_get_for_objects(self):
+        page, source = create_test_page(
+            title="Test page",
+            slug="test-page",
+        )
+        other_page, other_source = create_test_page(
+            title="Other page",
+            slug="other-page",
+        )
+        existing_resource = Resource.get_for_object(source.object)
+
+        resources = Resource.get_for_objects(
+            TranslatableObject.objects.filter(
+                pk__in=[source.object_id, other_source.object_id]
+            )
+        )
+
+        self.assertEqual(
+            resources,
+            {
+                source.object_id: existing_resource,
+                other_source.object_id: Resource.objects.get(
+                    object=other_source.object
+                ),
+            },
+        )
+        self.assertEqual(resources[other_source.object_id].path, "pages/other-page")
+
+    def test_get_for_objects_with_conflicting_path(self):
+        page, source = create_test_page(
+            title="Test page",
+            slug="test-page",
+        )
+        other_page, other_source = create_test_page(
+            title="Other page",
+            slug="other-page",
+        )
+
+        # Another object has already taken the path
+        Resource.objects.create(object=source.object, path="pages/other-page")
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Resource.get_for_objects(
+                TranslatableObject.objects.filter(pk=other_source.object_id)
+            )
+
     def test_get_path_for_page(self):
         page, source = create_test_page(
             title="Test page",
@@ -70,3 +121,29 @@ class TestResource(TestCase):
         self.assertEqual(
             Resource.get_path(site), "other/wagtailcore.Site/1-localhost-default"
         )
+
+
+class TestSyncLog(TestCase):
+    def test_add_translations(self):
+        page, source = create_test_page(
+            title="Test page",
+            slug="test-page",
+        )
+        locale_fr = Locale.objects.create(language_code="fr")
+        locale_de = Locale.objects.create(language_code="de")
+        translations = [
+            Translation.objects.create(source=source, target_locale=locale_fr),
+            Translation.objects.create(source=source, target_locale=locale_de),
+        ]
+
+        log = SyncLog.objects.create(action=SyncLog.ACTION_PUSH, commit_id="0" * 40)
+        log.add_translations(translations, batch_size=1)
+
+        resource = Resource.get_for_object(source.object)
+        self.assertEqual(
+            set(log.resources.values_list("resource_id", "locale_id", "source_id")),
+            {
+                (resource.id, locale_fr.id, source.id),
+                (resource.id, locale_de.id, source.id),
+            },
+        )
@@ -3,6 +3,7 @@ import unittest
 from pathlib import PurePosixPath
 from unittest import mock
 
+import polib
 import pygit2
 
 from django.test import TestCase, override_settings
@@ -11,7 +12,14 @@ from wagtail.models import Locale, Page
 from wagtail_localize.models import StringTranslation, Translation, TranslationSource
 
 from wagtail_localize_git.models import Resource, SyncLog
-from wagtail_localize_git.sync import SyncPushError, _pull, _push, get_sync_manager
+from wagtail_localize_git.sync import (
+    SyncPushError,
+    _get_changed_entries,
+    _pull,
+    _push,
+    get_sync_manager,
+    read_po_metadata,
+)
 
 from .utils import GitRepositoryUtils
 
@@ -25,6 +33,93 @@ def create_test_page(**kwargs):
     return page, source
 
 
+def create_test_po(entries, translation_id="1"):
+    po = polib.POFile(wrapwidth=200)
+    po.metadata = {"X-WagtailLocalize-TranslationID": translation_id}
+
+    for msgctxt, msgid, msgstr in entries:
+        po.append(polib.POEntry(msgctxt=msgctxt, msgid=msgid, msgstr=msgstr))
+
+    return po
+
+
+class TestGetChangedEntries(unittest.TestCase):
+    def test_get_changed_entries(self):
+        old_po = create_test_po(
+            [
+                ("title", "Title", "Titre"),
+                ("body", "Body", ""),
+            ]
+        )
+        new_po = create_test_po(
+            [
+                ("title", "Title", "Titre"),
+                ("body", "Body", "Corps"),
+                ("intro", "Intro", "Introduction"),
+            ],
+            translation_id="2",
+        )
+
+        changed_po = _get_changed_entries(old_po, new_po)
+
+        self.assertEqual(
+            [(entry.msgctxt, entry.msgid, entry.msgstr) for entry in changed_po],
+            [
+                ("body", "Body", "Corps"),
+                ("intro", "Intro", "Introduction"),
+            ],
+        )
+        self.assertEqual(changed_po.metadata, {"X-WagtailLocalize-TranslationID": "2"})
+
+    def test_get_changed_entries_ignores_comments_and_occurrences(self):
+        old_po = create_test_po([("title", "Title", "Titre")])
+        new_po = create_test_po([("title", "Title", "Titre")])
+        new_po[0].comment = "A comment"
+        new_po[0].occurrences = [("pages/test-page", "1")]
+
+        self.assertEqual(list(_get_changed_entries(old_po, new_po)), [])
+
+    def test_get_changed_entries_with_same_msgid_in_different_context(self):
+        old_po = create_test_po([("title", "Hello", "Bonjour")])
+        new_po = create_test_po(
+            [
+                ("title", "Hello", "Bonjour"),
+                ("body", "Hello", "Salut"),
+            ]
+        )
+
+        self.assertEqual(
+            [entry.msgctxt for entry in _get_changed_entries(old_po, new_po)],
+            ["body"],
+        )
+
+    def test_get_changed_entries_without_changes(self):
+        old_po = create_test_po([("title", "Title", "Titre")])
+        new_po = create_test_po([("title", "Title", "Titre")])
+
+        self.assertEqual(list(_get_changed_entries(old_po, new_po)), [])
+
+
+class TestReadPOMetadata(unittest.TestCase):
+    def test_read_po_metadata(self):
+        po = create_test_po(
+            [
+                ("title", "Title", "Titre"),
+                ("body", "Body", "Corps"),
+            ],
+            translation_id="b3e6cc6e-7a55-4c2b-ae45-0e1b5e3f3a94",
+        )
+        po.metadata["Content-Type"] = "text/plain; charset=utf-8"
+
+        self.assertEqual(
+            read_po_metadata(str(po)),
+            {
+                "X-WagtailLocalize-TranslationID": "b3e6cc6e-7a55-4c2b-ae45-0e1b5e3f3a94",
+                "Content-Type": "text/plain; charset=utf-8",
+            },
+        )
+
+
 class TestPull(GitRepositoryUtils, TestCase):
     def setUp(self):
         super().setUp()
@@ -173,6 +268,88 @@ class TestPull(GitRepositoryUtils, TestCase):
         self.assertEqual(string_translation.tool_name, "Pontoon")
         self.assertTrue(string_translation.has_error)
 
+    def test_pull_with_unknown_translation(self):
+        page, source, translation, resource = self.make_test_resource()
+
+        # Set up repo
+        repo = self.make_test_repo()
+
+        # page into repo and commit
+        push_commit_id = self.commit_translation(repo, resource, translation)
+
+        # Add a SyncLog entry
+        # Wagtail uses the synclog to know when to detect changes from
+        SyncLog.objects.create(action=SyncLog.ACTION_PUSH, commit_id=push_commit_id)
+
+        # Let's simulate Pontoon modifying the git repo
+        def add_french_string(translation_po):
+            translation_po[0].msgstr = "Certains tests de contenu traduisible"
+
+        self.commit_translation(
+            repo,
+            resource,
+            translation,
+            modify_locale_po=add_french_string,
+            commit_message="(Pontoon) Edited a translation",
+        )
+
+        # The translation was deleted in Wagtail since the last push
+        translation.delete()
+
+        # Run the pull code
+        logger = mock.MagicMock()
+        _pull(repo, logger)
+
+        # The file should be skipped with a warning
+        logger.warning.assert_called_once_with(
+            f"Pull: Unrecognised translation '{translation.uuid}' in file 'locales/fr/{resource.path}.po'"
+        )
+        self.assertFalse(StringTranslation.objects.exists())
+
+    def test_pull_with_only_comment_changes(self):
+        page, source, translation, resource = self.make_test_resource()
+
+        # Set up repo
+        repo = self.make_test_repo()
+
+        # Make sure the header stays the same between commits
+        def set_creation_date(translation_po):
+            translation_po.metadata["POT-Creation-Date"] = "2024-01-01 00:00+0000"
+
+        # page into repo and commit
+        push_commit_id = self.commit_translation(
+            repo, resource, translation, modify_locale_po=set_creation_date
+        )
+
+        # Add a SyncLog entry
+        # Wagtail uses the synclog to know when to detect changes from
+        SyncLog.objects.create(action=SyncLog.ACTION_PUSH, commit_id=push_commit_id)
+
+        # Let's simulate Pontoon adding a translator comment
+        def add_comment(translation_po):
+            set_creation_date(translation_po)
+            translation_po[0].tcomment = "Please review"
+
+        self.commit_translation(
+            repo,
+            resource,
+            translation,
+            modify_locale_po=add_comment,
+            commit_message="(Pontoon) Added a comment",
+        )
+
+        # Run the pull code
+        logger = mock.MagicMock()
+        with mock.patch("polib.pofile") as pofile:
+            _pull(repo, logger)
+
+        # The file shouldn't have been parsed or imported
+        pofile.assert_not_called()
+        logger.info.assert_any_call(
+            f"Pull: No translation changes in file 'locales/fr/{resource.path}.po'"
+        )
+        self.assertFalse(StringTranslation.objects.exists())
+
     def test_pull_without_changes(self):
         page, source, translation, resource = self.make_test_resource()
 
@@ -294,6 +471,150 @@ class TestPush(TestCase):
         # FIXME: Need to properly mock out repo.get_changed_files to test this properly
         self.assertFalse(log.resources.exists())
 
+    def test_push_logs_changed_translations(self):
+        page, source = create_test_page(
+            title="Test page",
+            slug="test-page",
+            test_charfield="Some test translatable content",
+        )
+        translation = Translation.objects.create(
+            source=source,
+            target_locale=self.locale_fr,
+        )
+        unknown_po = polib.POFile(wrapwidth=200)
+        unknown_po.metadata = {
+            "X-WagtailLocalize-TranslationID": "b3e6cc6e-7a55-4c2b-ae45-0e1b5e3f3a94"
+        }
+
+        repo = mock.MagicMock()
+        logger = mock.MagicMock()
+
+        repo.reader().read_file.side_effect = KeyError
+        repo.get_head_commit_id.return_value = "0" * 40
+        repo.writer().commit.return_value = "1" * 40
+        repo.push.return_value = True
+        repo.get_changed_files.return_value = [
+            (
+                "locales/fr/pages/test-page.po",
+                b"",
+                str(translation.export_po()).encode("utf-8"),
+            ),
+            ("locales/fr/pages/deleted-page.po", b"", str(unknown_po).encode("utf-8")),
+        ]
+
+        _push(repo, logger)
+
+        # The known translation should be logged
+        log = SyncLog.objects.get()
+        log_resource = log.resources.get()
+        self.assertEqual(log_resource.resource, Resource.get_for_object(source.object))
+        self.assertEqual(log_resource.locale, self.locale_fr)
+        self.assertEqual(log_resource.source, source)
+
+        # The unknown one should be skipped with a warning
+        logger.warning.assert_called_once_with(
+            "Push: Unrecognised translation 'b3e6cc6e-7a55-4c2b-ae45-0e1b5e3f3a94', not adding it to the log"
+        )
+
+    def test_push_writes_template_once(self):
+        page, source = create_test_page(
+            title="Test page",
+            slug="test-page",
+            test_charfield="Some test translatable content",
+        )
+        locale_de = Locale.objects.create(language_code="de")
+        Translation.objects.create(source=source, target_locale=self.locale_fr)
+        Translation.objects.create(source=source, target_locale=locale_de)
+
+        repo = mock.MagicMock()
+        logger = mock.MagicMock()
+
+        repo.reader().read_file.side_effect = KeyError
+        repo.get_head_commit_id.return_value = "0" * 40
+        repo.writer().commit.return_value = "1" * 40
+        repo.push.return_value = True
+
+        _push(repo, logger)
+
+        written_filenames = [
+            call.args[0] for call in repo.writer().write_file.mock_calls
+        ]
+        self.assertEqual(written_filenames.count("templates/pages/test-page.pot"), 1)
+        self.assertIn("locales/de/pages/test-page.po", written_filenames)
+        self.assertIn("locales/fr/pages/test-page.po", written_filenames)
+
+    def test_push_translation_missing_from_prefetched_resources(self):
+        page, source = create_test_page(
+            title="Test page",
+            slug="test-page",
+            test_charfield="Some test translatable content",
+        )
+        Translation.objects.create(
+            source=source,
+            target_locale=self.locale_fr,
+        )
+
+        repo = mock.MagicMock()
+        logger = mock.MagicMock()
+
+        repo.reader().read_file.side_effect = KeyError
+        repo.get_head_commit_id.return_value = "0" * 40
+        repo.writer().commit.return_value = "1" * 40
+        repo.push.return_value = True
+
+        # Simulate the translation being created after the resources were fetched
+        with mock.patch(
+            "wagtail_localize_git.sync.Resource.get_for_objects", return_value={}
+        ):
+            _push(repo, logger)
+
+        self.assertEqual(
+            Resource.objects.get(object=source.object).path, "pages/test-page"
+        )
+        written_filenames = [
+            call.args[0] for call in repo.writer().write_file.mock_calls
+        ]
+        self.assertIn("locales/fr/pages/test-page.po", written_filenames)
+
+    def test_push_reuses_unchanged_files(self):
+        page, source = create_test_page(
+            title="Test page",
+            slug="test-page",
+            test_charfield="Some test translatable content",
+        )
+        Translation.objects.create(
+            source=source,
+            target_locale=self.locale_fr,
+        )
+
+        repo = mock.MagicMock()
+        logger = mock.MagicMock()
+
+        repo.reader().read_file.side_effect = KeyError
+        repo.get_head_commit_id.return_value = "0" * 40
+        repo.writer().commit.return_value = "1" * 40
+        repo.push.return_value = True
+
+        _push(repo, logger)
+
+        # Push again, this time with the files that were written the first time already in the repo
+        files = {
+            call.args[0]: call.args[1].encode("utf-8")
+            for call in repo.writer().write_file.mock_calls
+        }
+        repo.reader().read_file.side_effect = files.__getitem__
+        repo.writer().write_file.reset_mock()
+
+        _push(repo, logger)
+
+        repo.writer().copy_file.assert_any_call(
+            repo.reader(), "templates/pages/test-page.pot"
+        )
+        repo.writer().copy_file.assert_any_call(
+            repo.reader(), "locales/fr/pages/test-page.po"
+        )
+        repo.writer().write_file.assert_not_called()
+
     def test_push_fail_raises_exception(self):
         repo = mock.MagicMock()
         logger = mock.MagicMock()
@@ -306,6 +627,9 @@ class TestPush(TestCase):
         with self.assertRaises(SyncPushError):
             _push(repo, logger)
 
+        # The push wasn't successful so it shouldn't be logged
+        self.assertFalse(SyncLog.objects.exists())
+
 
 class TestSyncManager(GitRepositoryUtils, TestCase):
     def setUp(self):